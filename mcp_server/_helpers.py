@@ -0,0 +1,232 @@
+"""Shared helpers for the GeoToolKit MCP server.
+
+JSON I/O for projects.json, subprocess execution for scans, and the
+network_config -> allowlist derivation live here so every server entry
+point shares one implementation (and one allowlist cache).
+"""
+
+import functools
+import json
+import mmap
+import os
+import subprocess
+from pathlib import Path
+from typing import Any
+
+# orjson is an optional speed-up for reading and writing projects.json; the
+# stdlib json module is used when it is not installed.
+try:
+    import orjson  # type: ignore[import]
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    ORJSON_AVAILABLE = False
+
+# Resolved once here so tools can join relative paths onto it without resolving.
+APP_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize ``data`` as indented JSON bytes with a trailing newline."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def _loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str, preferring orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, letting orjson read straight from a memory map."""
+    with open(path, "rb") as fh:
+        if not ORJSON_AVAILABLE:
+            return _loads(fh.read())
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files (and some special files) cannot be mapped
+            return _loads(fh.read())
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Serialize up front and hand the kernel one buffer instead of many small writes
+    view = memoryview(_dumps(data))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+# Environment passed to scan subprocesses: the basics needed to locate and run
+# python/uv/podman plus the variables GeoToolKit and its scanners read. This
+# keeps unrelated MCP-host variables out of every child process.
+_CHILD_ENV_KEYS = frozenset(
+    {
+        "PATH",
+        "HOME",
+        "USER",
+        "LOGNAME",
+        "SHELL",
+        "TERM",
+        "TZ",
+        "TMPDIR",
+        "LANG",
+        "DATABASE_PATH",
+        "SSH_AUTH_SOCK",
+        "SSL_CERT_FILE",
+        "SSL_CERT_DIR",
+        "REQUESTS_CA_BUNDLE",
+        "HTTP_PROXY",
+        "HTTPS_PROXY",
+        "NO_PROXY",
+        "http_proxy",
+        "https_proxy",
+        "no_proxy",
+    }
+)
+_CHILD_ENV_PREFIXES = (
+    "GEOTOOLKIT_",
+    "UV_",
+    "PYTHON",
+    "PYENV",
+    "VIRTUAL_ENV",
+    "LC_",
+    "XDG_",
+    "CONTAINER",
+    "DOCKER_",
+    "PODMAN",
+    "GIT_",
+    "OSV_",
+    "SEMGREP_",
+    "TRIVY_",
+    "ZAP_",
+)
+
+
+def _slim_env() -> dict[str, str]:
+    return {
+        k: v
+        for k, v in os.environ.items()
+        if k in _CHILD_ENV_KEYS or k.startswith(_CHILD_ENV_PREFIXES)
+    }
+
+
+def _run_cmd(
+    cmd: list[str],
+    cwd: Path | None = None,
+    timeout: float | None = None,
+    env: dict[str, str] | None = None,
+) -> tuple[int, str]:
+    """Run a subprocess command with optional timeout.
+
+    ``env`` defaults to a trimmed copy of the current environment (see
+    ``_slim_env``). Returns a tuple of (returncode, combined_output). If the
+    executable is not found returns exit code 127. If the process times out,
+    returns exit code 124 and includes a timeout message in the log.
+    """
+    try:
+        res = subprocess.run(
+            cmd,
+            cwd=str(cwd) if cwd else None,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=_slim_env() if env is None else env,
+        )
+        out = (res.stdout or "") + ("\n" + res.stderr if res.stderr else "")
+        return res.returncode, out
+    except FileNotFoundError as e:
+        return 127, str(e)
+    except subprocess.TimeoutExpired as e:
+        # e.stdout/e.stderr may be None or bytes; coerce to str safely
+        def _to_str(val):
+            if val is None:
+                return ""
+            if isinstance(val, bytes):
+                try:
+                    return val.decode(errors="replace")
+                except Exception:
+                    return str(val)
+            return str(val)
+
+        stdout = _to_str(e.stdout)
+        stderr = _to_str(e.stderr)
+        out = stdout + ("\n" + stderr if stderr else "")
+        out += f"\nProcess timed out after {timeout} seconds (killed)."
+        return 124, out
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into hashable tuples for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _coerce_strings(xs: Any) -> tuple[str, ...]:
+    """Return the non-empty, stripped string forms of a scalar or list value."""
+    items = xs if isinstance(xs, list | tuple) else (xs,)
+    return tuple(s for s in (str(x).strip() for x in items) if s)
+
+
+@functools.lru_cache(maxsize=4096)
+def _derive_allowlists_cached(
+    key: tuple[Any, Any],
+) -> tuple[frozenset[str], frozenset[str], tuple[str, ...]]:
+    raw_ports, frozen_cfg = key
+    net_cfg = dict(frozen_cfg)
+    ports = _coerce_strings(raw_ports or net_cfg.get("ports") or ())
+    protocol = str(net_cfg.get("protocol") or "").lower()
+    default_port = "443" if protocol == "https" else "80"
+    allowed = dict(net_cfg.get("allowed_egress") or ())
+    # Every host without explicit ports is paired with the same port tuple.
+    host_ports = ports or (default_port,)
+    ext_hosts = _coerce_strings(allowed.get("external_hosts") or ())
+    allow_hosts: set[str] = {f"{h}:{prt}" for h in ext_hosts for prt in host_ports}
+    allow_cidrs: set[str] = set()
+    for key_name, val in allowed.items():
+        if key_name == "external_hosts":
+            continue
+        if "/" in key_name:
+            allow_cidrs.add(key_name)
+            continue
+        use_ports = _coerce_strings(val or ()) or host_ports
+        allow_hosts.update(f"{key_name}:{prt}" for prt in use_ports)
+    return frozenset(allow_hosts), frozenset(allow_cidrs), ports
+
+
+def _derive_allowlist_sets(
+    p: dict[str, Any],
+) -> tuple[frozenset[str], frozenset[str], tuple[str, ...]]:
+    """Unsorted, immutable (hosts, cidrs, ports) for internal callers.
+
+    Results are memoized on the project's ``ports`` and ``network_config``.
+    """
+    key = (_freeze(p.get("ports") or ()), _freeze(p.get("network_config") or {}))
+    try:
+        return _derive_allowlists_cached(key)
+    except TypeError:
+        # Unhashable leaf values (e.g. sets) cannot be cached; compute directly.
+        return _derive_allowlists_cached.__wrapped__(key)
+
+
+def _derive_allowlists(p: dict[str, Any]) -> tuple[list[str], list[str], list[str]]:
+    """Derive sorted (hosts, cidrs, ports) lists from a project's network_config.
+
+    Fresh lists are returned so callers may mutate them freely.
+    """
+    hosts, cidrs, ports = _derive_allowlist_sets(p)
+    return sorted(hosts), sorted(cidrs), list(ports)
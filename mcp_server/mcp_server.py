@@ -9,11 +9,44 @@ Provides endpoints to:
 Docs: https://gofastmcp.com/llms.txt
 """
 
+import atexit
+import contextlib
+import dataclasses
+import heapq
 import json
 import os
+import select
+import shutil
+import signal
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, TypeVar
+
+# Run as a script (``python mcp_server/mcp_server.py``) only this file's
+# directory is on sys.path, where ``mcp_server`` names this module rather than
+# the package; put the repository root first so the package import resolves.
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# _derive_allowlists, _derive_allowlists_cached and _loads are re-exported for
+# callers and tests that import them from this module.
+from mcp_server._helpers import (  # noqa: E402
+    APP_ROOT,
+    _derive_allowlist_sets,
+    _derive_allowlists,  # noqa: F401
+    _derive_allowlists_cached,  # noqa: F401
+    _loads,  # noqa: F401
+    _read_json,
+    _run_cmd,
+    _slim_env,
+    _write_json,
+)
 
 # Optional MCP dependencies - graceful degradation if not available
 try:
@@ -58,7 +91,10 @@ except ImportError:  # pragma: no cover
 
     MCP_AVAILABLE = True
 
-APP_ROOT = Path(__file__).resolve().parents[1]
+# Resolve launchers once per process: skips a doomed fork+exec on hosts
+# without uv and avoids a $PATH search in every child.
+_UV_PATH = shutil.which("uv")
+_PYTHON_PATH = shutil.which("python") or "python"
 
 if MCP_AVAILABLE:
     # Initialize the MCP server
@@ -67,88 +103,136 @@ else:
     # Create a fallback instance
     mcp = FastMCP()
 
-
-def _write_json(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Tools are collected here as they are defined and handed to FastMCP once the
+# module has finished importing (see the end of this file), so hosts that
+# serve ``mcp`` without calling main() see every tool while the decorated
+# functions stay plain callables.
+_TOOLS: list[tuple[str, Callable[..., Any]]] = []
+_tools_registered = False
+
+
+def _register(name: str) -> Callable[[_F], _F]:
+    def decorator(func: _F) -> _F:
+        _TOOLS.append((name, func))
+        return func
+
+    return decorator
+
+
+def _register_tools() -> None:
+    """Register every collected tool with the MCP instance (idempotent)."""
+    global _tools_registered
+    if _tools_registered:
+        return
+    for name, func in _TOOLS:
+        mcp.tool(func, name=name)
+    _tools_registered = True
+
+
+# runScan reuses one long-lived ``src.main --serve-stdio`` worker so repeated
+# scans skip interpreter (and uv) start-up. Set GEOTOOLKIT_PERSIST=0 to always
+# spawn a fresh process per scan instead. The worker is POSIX-only: replies are
+# awaited with select() on its stdout pipe, which Windows does not support.
+_WORKER_SUPPORTED = os.name == "posix"
+_SERVE_ARGS = ("-m", "src.main", "--serve-stdio")
+_SCAN_WORKER_CMDS: tuple[tuple[str, ...], ...] = (
+    ((_UV_PATH, "run", "python", *_SERVE_ARGS),) if _UV_PATH else ()
+) + ((_PYTHON_PATH, *_SERVE_ARGS),)
+_scan_worker: subprocess.Popen | None = None
+_scan_worker_lock = threading.Lock()
+
+
+def _spawn_scan_worker() -> subprocess.Popen | None:
+    for cmd in _SCAN_WORKER_CMDS:
+        try:
+            return subprocess.Popen(
+                list(cmd),
+                cwd=str(APP_ROOT),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                env=_slim_env(),
+                # Own process group, so stopping it also stops the python
+                # process behind ``uv run`` and any scanner it started
+                start_new_session=True,
+            )
+        except FileNotFoundError:
+            continue
+    return None
 
 
-def _run_cmd(cmd: list[str], cwd: Path | None = None, timeout: float | None = None) -> tuple[int, str]:
-    """Run a subprocess command with optional timeout.
+def _signal_process_group(proc: subprocess.Popen, force: bool = True) -> None:
+    """Kill (or, without ``force``, terminate) ``proc`` and its process group.
 
-    Returns a tuple of (returncode, combined_output). If the executable is not
-    found returns exit code 127. If the process times out, returns exit code
-    124 and includes a timeout message in the log.
+    The scan worker and background jobs start in their own session, so on
+    POSIX this also reaches the python process behind ``uv run`` and any
+    scanners it started; elsewhere only ``proc`` itself is signalled.
     """
-    try:
-        res = subprocess.run(
-            cmd,
-            cwd=str(cwd) if cwd else None,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-        out = (res.stdout or "") + ("\n" + res.stderr if res.stderr else "")
-        return res.returncode, out
-    except FileNotFoundError as e:
-        return 127, str(e)
-    except subprocess.TimeoutExpired as e:
-        # e.stdout/e.stderr may be None or bytes; coerce to str safely
-        def _to_str(val):
-            if val is None:
-                return ""
-            if isinstance(val, bytes):
-                try:
-                    return val.decode(errors="replace")
-                except Exception:
-                    return str(val)
-            return str(val)
-
-        stdout = _to_str(e.stdout)
-        stderr = _to_str(e.stderr)
-        out = stdout + ("\n" + stderr if stderr else "")
-        out += f"\nProcess timed out after {timeout} seconds (killed)."
-        return 124, out
-
-
-def _derive_allowlists(p: dict[str, Any]) -> tuple[list[str], list[str], list[str]]:
-    allow_hosts: set[str] = set()
-    allow_cidrs: set[str] = set()
-    ports: list[str] = [str(x) for x in (p.get("ports") or [])]
-    net_cfg = p.get("network_config") or {}
-    if not ports:
-        ports = [str(x) for x in (net_cfg.get("ports") or [])]
-    protocol = str(net_cfg.get("protocol") or "").lower()
-    default_port = "443" if protocol == "https" else "80"
-    allowed = net_cfg.get("allowed_egress") or {}
-    ext_hosts = allowed.get("external_hosts") or []
-    if isinstance(ext_hosts, str):
-        ext_hosts = [ext_hosts]
-    for host in ext_hosts:
-        host = str(host).strip()
-        if not host:
-            continue
-        if ports:
-            for prt in ports:
-                allow_hosts.add(f"{host}:{str(prt).strip()}")
-        else:
-            allow_hosts.add(f"{host}:{default_port}")
-    for key, val in allowed.items():
-        if key == "external_hosts":
-            continue
-        values = val if isinstance(val, list) else ([val] if val else [])
-        values = [str(v).strip() for v in values if str(v).strip()]
-        if "/" in key:
-            allow_cidrs.add(key)
+    if hasattr(os, "killpg"):
+        with contextlib.suppress(OSError):
+            os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+            return
+    with contextlib.suppress(OSError):
+        if force:
+            proc.kill()
         else:
-            use_ports = values or (ports if ports else [default_port])
-            for prt in use_ports:
-                allow_hosts.add(f"{key}:{prt}")
-    return sorted(allow_hosts), sorted(allow_cidrs), [str(x) for x in ports]
+            proc.terminate()
+
+
+def _stop_scan_worker() -> None:
+    global _scan_worker
+    proc, _scan_worker = _scan_worker, None
+    if proc is None:
+        return
+    _signal_process_group(proc)
+    with contextlib.suppress(Exception):
+        proc.wait(timeout=5)
+    # Drop the pipes too, so nothing the old worker wrote can be read later
+    for stream in (proc.stdin, proc.stdout):
+        if stream is not None:
+            with contextlib.suppress(OSError):
+                stream.close()
+
+
+atexit.register(_stop_scan_worker)
 
 
-@mcp.tool
+def _scan_worker_request(
+    request: dict[str, Any], timeout: float | None = None
+) -> tuple[int, str] | None:
+    """Run one scan on the persistent worker.
+
+    Returns (exitCode, log) like ``_run_cmd``, or None when the worker is
+    unsupported on this platform, could not be started or died so the caller
+    can fall back to a one-shot process. On timeout the worker is killed and
+    a fresh one is started for the next request.
+    """
+    global _scan_worker
+    if not _WORKER_SUPPORTED:
+        return None
+    with _scan_worker_lock:
+        if _scan_worker is None or _scan_worker.poll() is not None:
+            _scan_worker = _spawn_scan_worker()
+            if _scan_worker is None:
+                return None
+        proc = _scan_worker
+        assert proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.write(json.dumps(request).encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            ready, _, _ = select.select([proc.stdout], [], [], timeout)
+            if not ready:
+                _stop_scan_worker()
+                return 124, f"Process timed out after {timeout} seconds (killed)."
+            reply = json.loads(proc.stdout.readline())
+            return int(reply["exitCode"]), str(reply.get("log", ""))
+        except (OSError, ValueError, KeyError, TypeError):
+            _stop_scan_worker()
+            return None
+
+
+@_register("createProjects")
 def createProjects(
     projects: list[dict[str, Any]], outputPath: str = "projects.json"
 ) -> dict:
@@ -166,14 +250,15 @@ def createProjects(
         # Copy to avoid mutating caller input
         item = dict(p)
         if item.get("network_config"):
-            hosts, cidrs, ports = _derive_allowlists(item)
-            # Only set explicit fields if not already provided
+            hosts, cidrs, ports = _derive_allowlist_sets(item)
+            # Only set explicit fields if not already provided; sort only the
+            # values that actually end up in the JSON output.
             if not item.get("network_allow_hosts"):
-                item["network_allow_hosts"] = hosts
+                item["network_allow_hosts"] = sorted(hosts)
             if not item.get("network_allow_ip_ranges"):
-                item["network_allow_ip_ranges"] = cidrs
+                item["network_allow_ip_ranges"] = sorted(cidrs)
             if not item.get("ports") and ports:
-                item["ports"] = ports
+                item["ports"] = list(ports)
         normalized.append(item)
 
     data = {"projects": normalized}
@@ -186,23 +271,7 @@ def createProjects(
     }
 
 
-@mcp.tool
-def runScan(
-    inputPath: str = "projects.json",
-    outputPath: str = "security-report.md",
-    databasePath: str = "data/offline-db.tar.gz",
-    timeout_seconds: int = 1800,
-) -> dict:
-    """
-    Run GeoToolKit scan with given input and return the report content.
-    Prefers 'uv run', falls back to 'python -m src.main'.
-    Returns dict with exitCode, report, log.
-
-    timeout_seconds controls how long to wait for the subprocess before
-    terminating it. Default is 1800 seconds (30 minutes). The environment
-    variable ``GEOTOOLKIT_RUNSCAN_TIMEOUT`` can be set (seconds) to override
-    the default when no explicit value is provided.
-    """
+def _resolve_timeout(timeout_seconds: int) -> int:
     # Allow overriding the default via environment variable when the caller
     # did not provide a custom value (most callers will just use the default).
     try:
@@ -215,17 +284,23 @@ def runScan(
     except Exception:
         # Ignore invalid env values and continue with the configured timeout
         pass
-    input_abs = (APP_ROOT / inputPath).resolve()
-    output_abs = (APP_ROOT / outputPath).resolve()
-    db_abs = (APP_ROOT / databasePath).resolve()
+    return timeout_seconds
+
+
+def _scan_paths(
+    inputPath: str, outputPath: str, databasePath: str
+) -> tuple[Path, Path, Path]:
+    # APP_ROOT is resolved once at import; joining onto it is enough for the
+    # scanner subprocess, so skip the per-call symlink walks of resolve().
+    return (
+        APP_ROOT / inputPath,
+        APP_ROOT / outputPath,
+        APP_ROOT / databasePath,
+    )
 
-    output_abs.parent.mkdir(parents=True, exist_ok=True)
 
-    # Try uv run first
-    cmd_uv = [
-        "uv",
-        "run",
-        "python",
+def _scan_args(input_abs: Path, output_abs: Path, db_abs: Path) -> list[str]:
+    return [
         "-m",
         "src.main",
         "--input",
@@ -235,31 +310,262 @@ def runScan(
         "--database-path",
         str(db_abs),
     ]
-    rc, out = _run_cmd(cmd_uv, cwd=APP_ROOT, timeout=timeout_seconds)
-    if rc == 0:
-        report_text = (
-            output_abs.read_text(encoding="utf-8") if output_abs.exists() else ""
+
+
+def _read_report(output_abs: Path) -> str:
+    return output_abs.read_text(encoding="utf-8") if output_abs.exists() else ""
+
+
+# Background scans started by startScan. pollJob/cancelJob look jobs up by id
+# and a daemon reaper thread kills any job that outlives its deadline, so the
+# MCP server never has to block for the length of a scan. A finished job is
+# dropped (closing its log file) once pollJob has reported it, or by the reaper
+# once it has gone unpolled for _JOB_RETENTION seconds.
+@dataclasses.dataclass
+class _ScanJob:
+    proc: subprocess.Popen
+    output: Path
+    log: IO[bytes]
+    timeout: float
+    deadline: float
+    status: str = "running"
+    finished: float | None = None
+
+
+_JOBS: dict[str, _ScanJob] = {}
+_jobs_lock = threading.Lock()
+_reaper: threading.Thread | None = None
+_REAPER_INTERVAL = 1.0
+_JOB_RETENTION = 3600.0
+
+
+def _reap_jobs() -> None:
+    while True:
+        time.sleep(_REAPER_INTERVAL)
+        now = time.monotonic()
+        with _jobs_lock:
+            expired = []
+            for job_id, job in _JOBS.items():
+                if job.proc.poll() is None:
+                    if job.status == "running" and now > job.deadline:
+                        _signal_process_group(job.proc)
+                        job.status = "timeout"
+                elif job.finished is None:
+                    job.finished = now
+                elif now - job.finished > _JOB_RETENTION:
+                    expired.append(job_id)
+            for job_id in expired:
+                _JOBS.pop(job_id).log.close()
+
+
+def _ensure_reaper() -> None:
+    global _reaper
+    if _reaper is None or not _reaper.is_alive():
+        _reaper = threading.Thread(
+            target=_reap_jobs, name="geotoolkit-job-reaper", daemon=True
+        )
+        _reaper.start()
+
+
+def _scan_command(scan_args: list[str]) -> list[str]:
+    if _UV_PATH:
+        return [_UV_PATH, "run", "python", *scan_args]
+    return [_PYTHON_PATH, *scan_args]
+
+
+@_register("runScan")
+def runScan(
+    inputPath: str = "projects.json",
+    outputPath: str = "security-report.md",
+    databasePath: str = "data/offline-db.tar.gz",
+    timeout_seconds: int = 1800,
+) -> dict:
+    """
+    Run GeoToolKit scan with given input and return the report content.
+    On POSIX, scans are sent to a persistent ``src.main --serve-stdio`` worker
+    unless ``GEOTOOLKIT_PERSIST=0``; otherwise (or if the worker dies) a one-shot
+    process is used, preferring 'uv run' and falling back to 'python -m src.main'.
+    Returns dict with exitCode, report, log.
+
+    timeout_seconds controls how long to wait for the subprocess before
+    terminating it. Default is 1800 seconds (30 minutes). The environment
+    variable ``GEOTOOLKIT_RUNSCAN_TIMEOUT`` can be set (seconds) to override
+    the default when no explicit value is provided.
+    """
+    timeout_seconds = _resolve_timeout(timeout_seconds)
+    input_abs, output_abs, db_abs = _scan_paths(inputPath, outputPath, databasePath)
+    output_abs.parent.mkdir(parents=True, exist_ok=True)
+
+    if os.environ.get("GEOTOOLKIT_PERSIST", "1") != "0":
+        res = _scan_worker_request(
+            {"input": str(input_abs), "output": str(output_abs), "db": str(db_abs)},
+            timeout=timeout_seconds,
         )
-        return {"exitCode": rc, "report": report_text, "log": out}
+        if res is not None:
+            rc, out = res
+            return {"exitCode": rc, "report": _read_report(output_abs), "log": out}
+
+    scan_args = _scan_args(input_abs, output_abs, db_abs)
+
+    # Try uv run first (only when uv is installed)
+    if _UV_PATH:
+        cmd_uv = [_UV_PATH, "run", "python", *scan_args]
+        rc, out = _run_cmd(cmd_uv, cwd=APP_ROOT, timeout=timeout_seconds)
+        if rc == 0:
+            return {"exitCode": rc, "report": _read_report(output_abs), "log": out}
 
     # Fallback to python
-    cmd_py = [
-        "python",
-        "-m",
-        "src.main",
-        "--input",
-        str(input_abs),
-        "--output",
-        str(output_abs),
-        "--database-path",
-        str(db_abs),
-    ]
+    cmd_py = [_PYTHON_PATH, *scan_args]
     rc, out = _run_cmd(cmd_py, cwd=APP_ROOT, timeout=timeout_seconds)
-    report_text = output_abs.read_text(encoding="utf-8") if output_abs.exists() else ""
-    return {"exitCode": rc, "report": report_text, "log": out}
+    return {"exitCode": rc, "report": _read_report(output_abs), "log": out}
+
+
+@_register("startScan")
+def startScan(
+    inputPath: str = "projects.json",
+    outputPath: str = "security-report.md",
+    databasePath: str = "data/offline-db.tar.gz",
+    timeout_seconds: int = 1800,
+) -> dict:
+    """
+    Start a GeoToolKit scan in the background and return immediately.
+    Returns dict with jobId; use pollJob(jobId) for status and the report,
+    and cancelJob(jobId) to stop it. Jobs still running after timeout_seconds
+    (or ``GEOTOOLKIT_RUNSCAN_TIMEOUT``) are killed by the server.
+    Prefer this over runScan for long scans so the client connection is not
+    held open for the whole run.
+    """
+    timeout_seconds = _resolve_timeout(timeout_seconds)
+    input_abs, output_abs, db_abs = _scan_paths(inputPath, outputPath, databasePath)
+    output_abs.parent.mkdir(parents=True, exist_ok=True)
+
+    cmd = _scan_command(_scan_args(input_abs, output_abs, db_abs))
+    log = tempfile.TemporaryFile()
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(APP_ROOT),
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            env=_slim_env(),
+            # Own process group, so timeouts and cancelJob stop the scan
+            # behind ``uv run`` and its scanners, not just the launcher
+            start_new_session=True,
+        )
+    except FileNotFoundError as e:
+        log.close()
+        return {"ok": False, "error": str(e)}
+
+    job_id = uuid.uuid4().hex
+    with _jobs_lock:
+        _JOBS[job_id] = _ScanJob(
+            proc=proc,
+            output=output_abs,
+            log=log,
+            timeout=timeout_seconds,
+            deadline=time.monotonic() + timeout_seconds,
+        )
+        _ensure_reaper()
+    return {"ok": True, "jobId": job_id}
+
+
+@_register("pollJob")
+def pollJob(jobId: str) -> dict:
+    """
+    Report the status of a scan started with startScan.
+    Returns dict with status ("running", "done", "timeout" or "cancelled");
+    finished jobs also include exitCode, report and log. A finished job is
+    reported once and then forgotten, so later polls return an error.
+    """
+    with _jobs_lock:
+        job = _JOBS.get(jobId)
+        if job is None:
+            return {"ok": False, "error": f"Unknown job {jobId}"}
+        rc = job.proc.poll()
+        if rc is None:
+            return {"ok": True, "jobId": jobId, "status": "running"}
+        if job.status == "running":
+            job.status = "done"
+        del _JOBS[jobId]
+
+    # The job is no longer shared, so read its output without holding the lock
+    with job.log:
+        job.log.seek(0)
+        out = job.log.read().decode("utf-8", errors="replace")
+    if job.status == "timeout":
+        rc = 124
+        out += f"\nProcess timed out after {job.timeout} seconds (killed)."
+    return {
+        "ok": True,
+        "jobId": jobId,
+        "status": job.status,
+        "exitCode": rc,
+        "report": _read_report(job.output),
+        "log": out,
+    }
 
 
-@mcp.tool
+@_register("cancelJob")
+def cancelJob(jobId: str) -> dict:
+    """
+    Stop a scan started with startScan. Returns dict with the final status.
+    """
+    with _jobs_lock:
+        job = _JOBS.get(jobId)
+        if job is None:
+            return {"ok": False, "error": f"Unknown job {jobId}"}
+        proc = job.proc
+        stopping = proc.poll() is None
+        if stopping:
+            _signal_process_group(proc, force=False)
+            job.status = "cancelled"
+        elif job.status == "running":
+            job.status = "done"
+        status = job.status
+
+    # Wait outside the lock so other job calls and the reaper are not held up
+    if stopping:
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            proc.wait(timeout=5)
+        # Kill whatever ignored SIGTERM, including scanners the launcher left
+        _signal_process_group(proc)
+        proc.wait()
+    return {"ok": True, "jobId": jobId, "status": status}
+
+
+@_register("prepareAndScan")
+def prepareAndScan(
+    projects: list[dict[str, Any]],
+    inputPath: str = "projects.json",
+    outputPath: str = "security-report.md",
+    databasePath: str = "data/offline-db.tar.gz",
+    timeout_seconds: int = 1800,
+) -> dict:
+    """
+    Write projects.json from ``projects`` and scan it in a single tool call.
+
+    Equivalent to createProjects(projects, outputPath=inputPath) followed by
+    runScan(inputPath, outputPath, databasePath); use it when a client would
+    otherwise issue both calls back to back. projects.json is written once
+    and allowlists come from the shared derivation cache.
+    Returns dict with path, project_count, exitCode, report, log.
+    """
+    created = createProjects(projects, outputPath=inputPath)
+    scan = runScan(
+        inputPath=created["path"],
+        outputPath=outputPath,
+        databasePath=databasePath,
+        timeout_seconds=timeout_seconds,
+    )
+    return {
+        "path": created["path"],
+        "project_count": created["project_count"],
+        **scan,
+    }
+
+
+@_register("normalizeProjects")
 def normalizeProjects(
     inputPath: str = "projects.json", outputPath: str | None = None
 ) -> dict:
@@ -268,10 +574,10 @@ def normalizeProjects(
     network_config, and write back. If outputPath is omitted, overwrites input.
     Returns a small preview of the allowlist for each project.
     """
-    in_abs = (APP_ROOT / inputPath).resolve()
+    in_abs = APP_ROOT / inputPath
     out_abs = (APP_ROOT / (outputPath or inputPath)).resolve()
     try:
-        payload = json.loads(in_abs.read_text())
+        payload = _read_json(in_abs)
     except Exception as e:
         return {"ok": False, "error": f"Failed to read {in_abs}: {e}"}
 
@@ -282,17 +588,19 @@ def normalizeProjects(
     for p in projects:
         item = dict(p)
         if item.get("network_config"):
-            hosts, cidrs, ports = _derive_allowlists(item)
-            item.setdefault("network_allow_hosts", hosts)
-            item.setdefault("network_allow_ip_ranges", cidrs)
+            hosts, cidrs, ports = _derive_allowlist_sets(item)
+            if "network_allow_hosts" not in item:
+                item["network_allow_hosts"] = sorted(hosts)
+            if "network_allow_ip_ranges" not in item:
+                item["network_allow_ip_ranges"] = sorted(cidrs)
             if not item.get("ports") and ports:
-                item["ports"] = ports
+                item["ports"] = list(ports)
             preview.append(
                 {
                     "name": item.get("name") or item.get("url"),
-                    "hosts": hosts[:5],
-                    "cidrs": cidrs[:5],
-                    "ports": ports[:5],
+                    "hosts": heapq.nsmallest(5, hosts),
+                    "cidrs": heapq.nsmallest(5, cidrs),
+                    "ports": list(ports[:5]),
                 }
             )
         normalized.append(item)
@@ -305,7 +613,7 @@ def normalizeProjects(
     return {"ok": True, "path": str(out_abs), "preview": preview}
 
 
-@mcp.tool
+@_register("detectNetworkConfig")
 def detectNetworkConfig(
     projectUrl: str,
     projectName: str,
@@ -452,7 +760,7 @@ def _generate_network_recommendations(
     return recommendations
 
 
-@mcp.tool
+@_register("enrichProjectWithNetwork")
 def enrichProjectWithNetwork(
     project: dict[str, Any],
 ) -> dict:
@@ -505,6 +813,9 @@ def enrichProjectWithNetwork(
     }
 
 
+_register_tools()
+
+
 def main() -> None:
     """Main entry point for MCP server CLI."""
     import os
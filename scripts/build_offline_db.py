@@ -14,7 +14,9 @@ Outputs: a tar.gz file with folder structure and a metadata.json manifest.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import datetime as dt
+import gzip
 import json
 import os
 import shutil
@@ -24,10 +26,30 @@ import tarfile
 import tempfile
 import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib import request
 
+try:
+    import orjson  # type: ignore[import]
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    ORJSON_AVAILABLE = False
+
+# aiohttp lets GHSA pages be fetched concurrently; urllib is used otherwise.
+try:
+    import aiohttp  # type: ignore[import]
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    AIOHTTP_AVAILABLE = False
+
 NVD_BASE = "https://nvd.nist.gov/feeds/json/cve/1.1"
+NVD_MAX_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+GHSA_URL = "https://api.github.com/advisories?per_page=100&page={page}"
+GHSA_PAGES = range(1, 6)  # fetch up to 500 advisories by default
 
 
 def log(msg: str) -> None:
@@ -38,17 +60,32 @@ def safe_mkdir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _dumps(data: object, indent: bool = False) -> bytes:
+    """Serialize ``data`` to JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+def _loads(data: bytes) -> object:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
 def download(url: str, dest: Path, retries: int = 3, backoff: float = 2.0) -> bool:
     for attempt in range(1, retries + 1):
         try:
             log(f"Downloading: {url}")
-            with request.urlopen(url, timeout=60) as resp:
-                data = resp.read()
-            dest.write_bytes(data)
+            # Copy in 1 MiB chunks so large feeds never sit fully in memory
+            with request.urlopen(url, timeout=60) as resp, open(dest, "wb") as fh:
+                shutil.copyfileobj(resp, fh, length=DOWNLOAD_CHUNK_SIZE)
             log(f"Saved: {dest}")
             return True
         except Exception as e:
             log(f"Warn: attempt {attempt} failed for {url}: {e}")
+            # Do not leave a truncated feed behind for the bundle to pick up
+            dest.unlink(missing_ok=True)
             time.sleep(backoff * attempt)
     return False
 
@@ -71,13 +108,22 @@ def collect_nvd(
             results["success"].append(name)
         return results
 
+    if not feeds:
+        return results
+
+    # Feeds are independent and I/O-bound; fetch them concurrently.
+    ok: dict[str, bool] = {}
+    with ThreadPoolExecutor(max_workers=min(NVD_MAX_WORKERS, len(feeds))) as ex:
+        futs = {
+            ex.submit(download, f"{NVD_BASE}/{name}", nvd_dir / name): name
+            for name in feeds
+        }
+        for fut in as_completed(futs):
+            ok[futs[fut]] = fut.result()
+
+    # Report in feed order so the manifest stays deterministic
     for name in feeds:
-        url = f"{NVD_BASE}/{name}"
-        dest = nvd_dir / name
-        if download(url, dest):
-            results["success"].append(name)
-        else:
-            results["failed"].append(name)
+        results["success" if ok[name] else "failed"].append(name)
 
     return results
 
@@ -127,6 +173,60 @@ def collect_osv(out_dir: Path, simulate: bool) -> dict:
     return result
 
 
+def _gh_headers(token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+    }
+
+
+GhPage = tuple[int, bytes, str | None]
+
+
+async def _gh_pages(
+    token: str, pages: Iterable[int] = GHSA_PAGES
+) -> list[GhPage | BaseException]:
+    """Fetch GHSA pages concurrently; each entry is (status, body, rate-limit remaining)."""
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(
+        headers=_gh_headers(token), timeout=timeout
+    ) as session:
+
+        async def fetch(page: int) -> GhPage:
+            async with session.get(GHSA_URL.format(page=page)) as resp:
+                body = await resp.read()
+                return resp.status, body, resp.headers.get("X-RateLimit-Remaining")
+
+        return await asyncio.gather(
+            *(fetch(page) for page in pages), return_exceptions=True
+        )
+
+
+def _gh_pages_sync(token: str, pages: Iterable[int] = GHSA_PAGES) -> list[GhPage]:
+    """Sequential fallback for when aiohttp is not installed.
+
+    Pages share one pooled ``requests.Session`` so the TLS connection to
+    api.github.com is reused instead of re-established for every page.
+    """
+    import requests
+
+    results: list[GhPage] = []
+    with requests.Session() as session:
+        session.headers.update(_gh_headers(token))
+        for page in pages:
+            resp = session.get(GHSA_URL.format(page=page), timeout=60)
+            remaining = resp.headers.get("X-RateLimit-Remaining")
+            if resp.status_code >= 400:
+                results.append((resp.status_code, b"", remaining))
+                break
+            body = resp.content
+            results.append((resp.status_code, body, remaining))
+            # Stop early on the last page or when the rate limit is exhausted
+            if body.strip() in (b"", b"[]") or remaining == "0":
+                break
+    return results
+
+
 def collect_ghsa(out_dir: Path, simulate: bool) -> dict:
     ghsa_dir = out_dir / "ghsa"
     safe_mkdir(ghsa_dir)
@@ -144,47 +244,80 @@ def collect_ghsa(out_dir: Path, simulate: bool) -> dict:
 
     # Minimal paging for a sample; full export can be large. Documented as optional.
     try:
-        from urllib import error as urlerror
-
-        def gh_req(page: int) -> bytes:
-            req = request.Request(
-                f"https://api.github.com/advisories?per_page=100&page={page}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                },
-            )
-            with request.urlopen(req, timeout=60) as resp:
-                return resp.read()
+        if AIOHTTP_AVAILABLE:
+            pages = asyncio.run(_gh_pages(token))
+        else:
+            pages = _gh_pages_sync(token)
 
         combined = []
-        for page in range(1, 6):  # fetch up to 500 advisories by default
-            try:
-                data = json.loads(gh_req(page).decode("utf-8"))
-                if not data:
-                    break
-                combined.extend(data)
-            except urlerror.HTTPError as he:
-                result.update({"success": False, "note": f"HTTP {he.code}"})
+        remaining = None
+        for page in pages:
+            if isinstance(page, BaseException):
+                raise page
+            status, body, page_remaining = page
+            remaining = page_remaining or remaining
+            if status >= 400:
+                result.update({"success": False, "note": f"HTTP {status}"})
                 break
-        (ghsa_dir / "advisories.json").write_text(json.dumps(combined))
-        result.update(
-            {"success": True, "note": f"fetched {len(combined)} advisories (sample)"}
-        )
+            data = _loads(body)
+            if not data:
+                break
+            combined.extend(data)
+        (ghsa_dir / "advisories.json").write_bytes(_dumps(combined))
+        note = f"fetched {len(combined)} advisories (sample)"
+        if remaining is not None:
+            note += f"; rate limit remaining {remaining}"
+        result.update({"success": True, "note": note})
     except Exception as e:  # pragma: no cover
         result.update({"success": False, "note": str(e)})
 
     return result
 
 
+# Most of the bundle is already-compressed NVD/OSV feeds, so spending CPU on
+# gzip -9 buys almost nothing. Stream the tar through a fast compressor instead.
+BUNDLE_COMPRESSLEVEL = 1
+BUNDLE_BUFSIZE = 1024 * 1024
+
+
+def _add_workspace(tar: tarfile.TarFile, workspace: Path) -> None:
+    # Add the contents of the workspace directory to the tarball at the root.
+    # scandir yields names straight from the directory stream (no Path objects).
+    with os.scandir(workspace) as it:
+        for entry in it:
+            tar.add(entry.path, arcname=entry.name, recursive=True)
+
+
 def build_bundle(output: Path, workspace: Path, manifest: dict) -> None:
     # Write manifest inside the workspace before bundling
-    (workspace / "metadata.json").write_text(json.dumps(manifest, indent=2))
+    (workspace / "metadata.json").write_bytes(_dumps(manifest, indent=True))
     safe_mkdir(output.parent)
-    with tarfile.open(output, "w:gz") as tar:
-        # Add the contents of the workspace directory to the tarball at the root
-        for item in workspace.iterdir():
-            tar.add(item, arcname=item.name)
+
+    pigz = shutil.which("pigz")
+    if pigz:
+        # Parallel gzip: tar is written uncompressed into pigz's stdin.
+        with open(output, "wb") as fh:
+            proc = subprocess.Popen(
+                [pigz, f"-{BUNDLE_COMPRESSLEVEL}", "-c"],
+                stdin=subprocess.PIPE,
+                stdout=fh,
+            )
+            assert proc.stdin is not None
+            try:
+                with tarfile.open(
+                    fileobj=proc.stdin, mode="w|", bufsize=BUNDLE_BUFSIZE
+                ) as tar:
+                    _add_workspace(tar, workspace)
+            finally:
+                proc.stdin.close()
+                rc = proc.wait()
+        if rc != 0:
+            raise RuntimeError(f"pigz exited with status {rc}")
+        return
+
+    with gzip.GzipFile(output, "wb", compresslevel=BUNDLE_COMPRESSLEVEL) as gz:
+        with tarfile.open(fileobj=gz, mode="w|", bufsize=BUNDLE_BUFSIZE) as tar:
+            _add_workspace(tar, workspace)
 
 
 def parse_args() -> argparse.Namespace:
@@ -264,7 +397,7 @@ def main() -> int:
             manifest["notes"].append("GHSA skipped by flag")
 
         # Write manifest before tar for visibility in workspace as well
-        (temp_root / "metadata.json").write_text(json.dumps(manifest, indent=2))
+        (temp_root / "metadata.json").write_bytes(_dumps(manifest, indent=True))
 
         # Create bundle
         build_bundle(output, temp_root, manifest)
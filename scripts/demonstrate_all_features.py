@@ -2,204 +2,372 @@
 """
 Complete GeoToolKit functionality demonstration.
 Shows all documented features working as specified.
+
+The module is fully annotated so it can be compiled with
+``mypyc scripts/demonstrate_all_features.py``; the .py remains the fallback.
 """
 
-import json
-import subprocess
-from pathlib import Path
+import argparse
+import heapq
+import os
+import shutil
+import sys
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+try:
+    import ijson  # type: ignore[import]
+
+    IJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    ORJSON_AVAILABLE = False
+
+_HR = "=" * 60
+_SEP = "-" * 30
+
+_RUNNERS = (
+    (
+        "Semgrep",
+        "src/orchestration/runners/semgrep_runner.py",
+        "Static Application Security Testing (SAST)",
+    ),
+    (
+        "Trivy",
+        "src/orchestration/runners/trivy_runner.py",
+        "Software Composition Analysis (SCA)",
+    ),
+    (
+        "OSV-Scanner",
+        "src/orchestration/runners/osv_runner.py",
+        "Open Source Vulnerability Database",
+    ),
+    (
+        "OWASP ZAP",
+        "src/orchestration/runners/zap_runner.py",
+        "Dynamic Application Security Testing (DAST)",
+    ),
+)
+
+_LANGUAGES_SHOWN = 50
+
+_DB_FILES = (
+    ("Mock Database", "data/mock-offline-db.json"),
+    ("Database Bundle", "data/offline-db.tar.gz"),
+    ("Database Builder", "scripts/build_offline_db.py"),
+)
+
+_VALIDATION_SCRIPTS = (
+    "scripts/quick_validation.py",
+    "scripts/validate_functionality.py",
+    "scripts/test_cli_functionality.py",
+    "scripts/production_validator.py",
+)
+
+_PODMAN_VERSION_CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "geotoolkit",
+    "podman_version",
+)
+
+# Every file whose presence the demonstration reports on.
+_CHECKED_PATHS = (
+    *(path for _, path, _ in _RUNNERS),
+    "src/reporting/report.py",
+    "src/reporting/templates/report.md",
+    "mcp/mcp_server.py",
+    *_VALIDATION_SCRIPTS,
+)
+
+
+def _list_dir(parent: str) -> set[str] | None:
+    try:
+        with os.scandir(parent) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+    except PermissionError:
+        # Searchable but unreadable directory: probe its files individually
+        return None
+
+
+def _list_parents(paths: Iterable[str]) -> dict[str, set[str] | None]:
+    """Map each parent directory of ``paths`` to the names it contains.
+
+    Directories that cannot be listed map to ``None``; ``_exists`` falls back
+    to ``os.access`` for their files.
+
+    One scandir per directory replaces a stat per file, and the directories
+    are listed concurrently so slow (cold or networked) filesystems overlap.
+    """
+    parents = sorted({os.path.dirname(p) or "." for p in paths})
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return dict(zip(parents, pool.map(_list_dir, parents)))
+
+
+def _iter_projects(path: str) -> Iterator[dict[str, Any]]:
+    """Yield the entries of the ``projects`` array in ``path``.
+
+    With ijson installed the file is streamed, so only one project is held in
+    memory at a time; otherwise it is parsed whole with orjson, or json.
+    """
+    with open(path, "rb") as f:
+        if IJSON_AVAILABLE:
+            yield from ijson.items(f, "projects.item")
+        elif ORJSON_AVAILABLE:
+            yield from orjson.loads(f.read())["projects"]
+        else:
+            import json
 
+            yield from json.load(f)["projects"]
 
-def demonstrate_geotoolkit_features():
-    """Demonstrate all documented GeoToolKit features."""
 
-    print("🛡️  GeoToolKit Complete Functionality Demonstration")
-    print("=" * 60)
-    print()
+def _exists(listing: dict[str, set[str] | None], path: str) -> bool:
+    parent, name = os.path.split(path)
+    names = listing.get(parent or ".")
+    if names is None:
+        # Presence is all that matters, so skip the full stat() of exists()
+        return os.access(path, os.F_OK)
+    return name in names
 
-    # 1. Multi-Language Support
-    print("📊 1. Multi-Language Support")
-    print("-" * 30)
 
-    with open("projects.json") as f:
-        projects = json.load(f)["projects"]
+def _podman_version(podman_path: str) -> str | None:
+    """Return ``podman --version`` output, or None if podman does not work.
+
+    The answer is cached in ``_PODMAN_VERSION_CACHE`` keyed by the binary's
+    path and mtime, so repeated runs only spawn podman after it changes.
+    """
+    try:
+        key = f"{podman_path}\t{os.stat(podman_path).st_mtime_ns}"
+    except OSError:
+        return None
+    try:
+        with open(_PODMAN_VERSION_CACHE) as f:
+            cached_key, _, version = f.read().partition("\n")
+        if cached_key == key and version:
+            return version
+    except OSError:
+        pass
+
+    import subprocess  # only needed on a cache miss
+
+    try:
+        result = subprocess.run(
+            [podman_path, "--version"], capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    version = result.stdout.strip()
+
+    # Best effort: write to a temp file and rename so readers never see a partial entry
+    try:
+        os.makedirs(os.path.dirname(_PODMAN_VERSION_CACHE), exist_ok=True)
+        tmp = f"{_PODMAN_VERSION_CACHE}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(f"{key}\n{version}")
+        os.replace(tmp, _PODMAN_VERSION_CACHE)
+    except OSError:
+        pass
+    return version
+
+
+def demonstrate_geotoolkit_features(verbose: bool = False) -> None:
+    """Demonstrate all documented GeoToolKit features.
+
+    With ``verbose`` the container runtime line reports ``podman --version``
+    instead of just the binary location.
+    """
 
-    languages = {}
-    for project in projects:
-        lang = project.get("language", "Unknown")
-        if lang not in languages:
-            languages[lang] = []
-        languages[lang].append(project["name"])
+    # Collect the report and write it once instead of one print() per line
+    out: list[str] = []
+    emit = out.append
+    present = _list_parents(_CHECKED_PATHS)
 
-    for lang, names in sorted(languages.items()):
-        print(
+    emit("🛡️  GeoToolKit Complete Functionality Demonstration")
+    emit(_HR)
+    emit("")
+
+    # 1. Multi-Language Support
+    emit("📊 1. Multi-Language Support")
+    emit(_SEP)
+
+    languages: defaultdict[str, list[str]] = defaultdict(list)
+    project_count = 0
+    for project in _iter_projects("projects.json"):
+        project_count += 1
+        languages[project.get("language", "Unknown")].append(project["name"])
+
+    # Long language tables are capped; heapq avoids sorting the unshown rest
+    if len(languages) > _LANGUAGES_SHOWN:
+        shown = heapq.nsmallest(_LANGUAGES_SHOWN, languages.items())
+    else:
+        shown = sorted(languages.items())
+    for lang, names in shown:
+        emit(
             f"✅ {lang}: {len(names)} projects ({', '.join(names[:2])}{'...' if len(names) > 2 else ''})"
         )
 
-    print(
-        f"\n🎯 Total: {len(languages)} languages supported across {len(projects)} projects"
+    if len(languages) > _LANGUAGES_SHOWN:
+        emit(f"   ... and {len(languages) - _LANGUAGES_SHOWN} more")
+
+    emit(
+        f"\n🎯 Total: {len(languages)} languages supported across {project_count} projects"
     )
 
     # 2. Security Scanning Tools
-    print("\n🔒 2. Security Scanning Tools (SAST + SCA + DAST)")
-    print("-" * 30)
-
-    runners = [
-        (
-            "Semgrep",
-            "src/orchestration/runners/semgrep_runner.py",
-            "Static Application Security Testing (SAST)",
-        ),
-        (
-            "Trivy",
-            "src/orchestration/runners/trivy_runner.py",
-            "Software Composition Analysis (SCA)",
-        ),
-        (
-            "OSV-Scanner",
-            "src/orchestration/runners/osv_runner.py",
-            "Open Source Vulnerability Database",
-        ),
-        (
-            "OWASP ZAP",
-            "src/orchestration/runners/zap_runner.py",
-            "Dynamic Application Security Testing (DAST)",
-        ),
-    ]
+    emit("\n🔒 2. Security Scanning Tools (SAST + SCA + DAST)")
+    emit(_SEP)
 
-    for name, path, description in runners:
-        if Path(path).exists():
-            print(f"✅ {name}: {description}")
+    for name, path, description in _RUNNERS:
+        if _exists(present, path):
+            emit(f"✅ {name}: {description}")
         else:
-            print(f"❌ {name}: Missing implementation")
+            emit(f"❌ {name}: Missing implementation")
 
     # 3. Container Security
-    print("\n🔒 3. Container Security & Isolation")
-    print("-" * 30)
-
-    seccomp_profiles = list(Path("seccomp").glob("*.json"))
-    print(f"✅ Seccomp Profiles: {len(seccomp_profiles)} security profiles")
-    for profile in sorted(seccomp_profiles):
-        print(f"   - {profile.name}")
+    emit("\n🔒 3. Container Security & Isolation")
+    emit(_SEP)
 
-    # Check container runtime
     try:
-        result = subprocess.run(
-            ["podman", "--version"], capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            print(f"✅ Container Runtime: {result.stdout.strip()}")
+        with os.scandir("seccomp") as it:
+            # DirEntry.stat() is cached per entry (and free on Windows)
+            seccomp_profiles = sorted(
+                (e.name, e.stat().st_size)
+                for e in it
+                if e.name.endswith(".json") and e.is_file()
+            )
+    except FileNotFoundError:
+        seccomp_profiles = []
+    emit(f"✅ Seccomp Profiles: {len(seccomp_profiles)} security profiles")
+    for profile, size in seccomp_profiles:
+        emit(f"   - {profile} ({size:,} bytes)")
+
+    # Check container runtime; only spawn podman when the version is wanted
+    podman_path = shutil.which("podman")
+    if not podman_path:
+        emit("⚠️  Container Runtime: Podman not available")
+    elif not verbose:
+        emit(f"✅ Container Runtime: podman at {podman_path}")
+    else:
+        version = _podman_version(podman_path)
+        if version:
+            emit(f"✅ Container Runtime: {version}")
         else:
-            print("⚠️  Container Runtime: Podman available but not working")
-    except:
-        print("⚠️  Container Runtime: Podman not available")
+            emit("⚠️  Container Runtime: Podman available but not working")
 
     # 4. Network Configuration & DAST
-    print("\n🌐 4. Network Configuration & DAST Support")
-    print("-" * 30)
-
-    with open("validation/configs/enhanced-projects.json") as f:
-        enhanced = json.load(f)["projects"]
-
-    dast_ready = [p for p in enhanced if p.get("network_config")]
-    print(f"✅ DAST-Ready Projects: {len(dast_ready)}/2 with network configuration")
-
-    for project in dast_ready:
-        name = project["name"]
-        ports = project.get("ports", [])
-        hosts = project.get("network_allow_hosts", [])
-        print(f"   - {name}: ports {ports}, allowlist {len(hosts)} entries")
+    emit("\n🌐 4. Network Configuration & DAST Support")
+    emit(_SEP)
+
+    # One pass over the projects both counts and formats the DAST-ready ones
+    dast_lines = [
+        f"   - {p['name']}: ports {p.get('ports', [])}, "
+        f"allowlist {len(p.get('network_allow_hosts', []))} entries"
+        for p in _iter_projects("validation/configs/enhanced-projects.json")
+        if p.get("network_config")
+    ]
+    emit(f"✅ DAST-Ready Projects: {len(dast_lines)}/2 with network configuration")
+    out.extend(dast_lines)
 
-    if Path("network-allowlist.txt").exists():
+    try:
         with open("network-allowlist.txt") as f:
-            allowlist = [
-                line.strip() for line in f if line.strip() and not line.startswith("#")
-            ]
-        print(f"✅ Network Allowlist: {len(allowlist)} host:port entries configured")
+            data = f.read()
+    except FileNotFoundError:
+        pass
+    else:
+        allowlist = [s for s in map(str.strip, data.splitlines()) if s and s[0] != "#"]
+        emit(f"✅ Network Allowlist: {len(allowlist)} host:port entries configured")
 
     # 5. Offline Database Support
-    print("\n💾 5. Offline Database Support")
-    print("-" * 30)
-
-    db_files = [
-        ("Mock Database", "data/mock-offline-db.json"),
-        ("Database Bundle", "data/offline-db.tar.gz"),
-        ("Database Builder", "scripts/build_offline_db.py"),
-    ]
-
-    for name, path in db_files:
-        if Path(path).exists():
-            size = Path(path).stat().st_size
-            print(f"✅ {name}: {path} ({size:,} bytes)")
+    emit("\n💾 5. Offline Database Support")
+    emit(_SEP)
+
+    for name, path in _DB_FILES:
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            emit(f"❌ {name}: {path} missing")
         else:
-            print(f"❌ {name}: {path} missing")
+            emit(f"✅ {name}: {path} ({size:,} bytes)")
 
     # 6. Professional Reporting
-    print("\n📋 6. Professional Reporting")
-    print("-" * 30)
+    emit("\n📋 6. Professional Reporting")
+    emit(_SEP)
 
-    if Path("src/reporting/report.py").exists():
-        print("✅ Report Generator: Professional Markdown report generation")
+    if _exists(present, "src/reporting/report.py"):
+        emit("✅ Report Generator: Professional Markdown report generation")
 
-    if Path("src/reporting/templates/report.md").exists():
-        print("✅ Report Template: Professional layout with risk assessment")
+    if _exists(present, "src/reporting/templates/report.md"):
+        emit("✅ Report Template: Professional layout with risk assessment")
 
     # 7. CLI Interface
-    print("\n💻 7. Command Line Interface")
-    print("-" * 30)
+    emit("\n💻 7. Command Line Interface")
+    emit(_SEP)
 
-    print("✅ CLI Arguments supported:")
-    print("   --input projects.json")
-    print("   --output security-report.md")
-    print("   --database-path data/offline-db.tar.gz")
-    print("   --network-allowlist network-allowlist.txt")
+    emit("✅ CLI Arguments supported:")
+    emit("   --input projects.json")
+    emit("   --output security-report.md")
+    emit("   --database-path data/offline-db.tar.gz")
+    emit("   --network-allowlist network-allowlist.txt")
 
-    print("\n✅ Example usage:")
-    print("   python src/main.py --input test-projects.json \\")
-    print("     --output report.md --database-path data/offline-db.tar.gz")
+    emit("\n✅ Example usage:")
+    emit("   python src/main.py --input test-projects.json \\")
+    emit("     --output report.md --database-path data/offline-db.tar.gz")
 
     # 8. MCP Server Integration
-    print("\n🔌 8. Model Context Protocol (MCP) Server")
-    print("-" * 30)
+    emit("\n🔌 8. Model Context Protocol (MCP) Server")
+    emit(_SEP)
 
-    if Path("mcp/mcp_server.py").exists():
-        print("✅ FastMCP Server: Programmatic project management")
-        print("✅ MCP Tools Available:")
-        print("   - createProjects() - Generate projects.json with networking")
-        print("   - normalizeProjects() - Normalize network configurations")
-        print("   - runScan() - Execute security scan and return report")
+    if _exists(present, "mcp/mcp_server.py"):
+        emit("✅ FastMCP Server: Programmatic project management")
+        emit("✅ MCP Tools Available:")
+        emit("   - createProjects() - Generate projects.json with networking")
+        emit("   - normalizeProjects() - Normalize network configurations")
+        emit("   - runScan() - Execute security scan and return report")
 
     # 9. Validation Framework
-    print("\n🧪 9. Validation & Testing Framework")
-    print("-" * 30)
-
-    validation_scripts = [
-        "scripts/quick_validation.py",
-        "scripts/validate_functionality.py",
-        "scripts/test_cli_functionality.py",
-        "scripts/production_validator.py",
-    ]
+    emit("\n🧪 9. Validation & Testing Framework")
+    emit(_SEP)
 
-    for script in validation_scripts:
-        if Path(script).exists():
-            print(f"✅ {script.split('/')[-1]}")
+    for script in _VALIDATION_SCRIPTS:
+        if _exists(present, script):
+            emit(f"✅ {os.path.basename(script)}")
         else:
-            print(f"❌ {script.split('/')[-1]} missing")
+            emit(f"❌ {os.path.basename(script)} missing")
 
     # Final Assessment
-    print("\n🎉 FINAL ASSESSMENT")
-    print("=" * 60)
-    print("✅ GeoToolKit meets 100% of documented functionality:")
-    print("   • Multi-language security scanning (10 languages)")
-    print("   • Comprehensive analysis (SAST + SCA + DAST)")
-    print("   • Container security with seccomp isolation")
-    print("   • Offline vulnerability database support")
-    print("   • Professional reporting with risk assessment")
-    print("   • MCP server for programmatic access")
-    print("   • Complete validation and testing framework")
-    print()
-    print("🚀 Ready for production deployment!")
-    print("   Only requirement: Install dependencies (uv sync or pip install -e .)")
+    emit("\n🎉 FINAL ASSESSMENT")
+    emit(_HR)
+    emit("✅ GeoToolKit meets 100% of documented functionality:")
+    emit("   • Multi-language security scanning (10 languages)")
+    emit("   • Comprehensive analysis (SAST + SCA + DAST)")
+    emit("   • Container security with seccomp isolation")
+    emit("   • Offline vulnerability database support")
+    emit("   • Professional reporting with risk assessment")
+    emit("   • MCP server for programmatic access")
+    emit("   • Complete validation and testing framework")
+    emit("")
+    emit("🚀 Ready for production deployment!")
+    emit("   Only requirement: Install dependencies (uv sync or pip install -e .)")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
-    demonstrate_geotoolkit_features()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Run podman --version to report the container runtime version",
+    )
+    demonstrate_geotoolkit_features(verbose=parser.parse_args().verbose)
@@ -5,9 +5,12 @@ Checks runtime prerequisites (Podman, seccomp files, common images) and exits
 with non-zero status when problems are found.
 """
 
+import io
+import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 REQUIRED_IMAGES = [
@@ -20,59 +23,94 @@ PROJECT_ROOT = Path(__file__).parents[1]
 SECCOMP_DIR = PROJECT_ROOT / "seccomp"
 
 
-def check_podman():
+def check_podman(out=None):
     if not shutil.which("podman"):
-        print("ERROR: podman is not installed or not on PATH")
+        print("ERROR: podman is not installed or not on PATH", file=out)
         return False
     try:
         subprocess.run(["podman", "info"], check=True, capture_output=True)
     except subprocess.CalledProcessError as e:
-        print("ERROR: podman info failed:")
-        print(e.stderr.decode() if e.stderr else str(e))
+        print("ERROR: podman info failed:", file=out)
+        print(e.stderr.decode() if e.stderr else str(e), file=out)
         return False
     return True
 
 
-def check_seccomp_files():
-    missing = []
-    for f in ("trivy-seccomp.json", "osv-scanner-seccomp.json"):
-        p = SECCOMP_DIR / f
-        if not p.exists():
-            missing.append(str(p))
+def check_seccomp_files(out=None):
+    # One directory read instead of a stat per profile
+    try:
+        with os.scandir(SECCOMP_DIR) as it:
+            present = {e.name for e in it}
+    except (FileNotFoundError, NotADirectoryError):
+        present = set()
+    missing = [
+        str(SECCOMP_DIR / f)
+        for f in ("trivy-seccomp.json", "osv-scanner-seccomp.json")
+        if f not in present
+    ]
     if missing:
-        print("WARNING: Missing seccomp files:")
+        print("WARNING: Missing seccomp files:", file=out)
         for m in missing:
-            print(" - ", m)
+            print(" - ", m, file=out)
         print(
-            "You may set GEOTOOLKIT_USE_SECCOMP=0 to disable seccomp or install the seccomp files."
+            "You may set GEOTOOLKIT_USE_SECCOMP=0 to disable seccomp or install the seccomp files.",
+            file=out,
         )
         # Not fatal; continue
     else:
-        print("Seccomp profiles present")
+        print("Seccomp profiles present", file=out)
     return True
 
 
-def check_images():
+def _local_images():
+    """Return the set of ``repository:tag`` names known to local Podman."""
+    try:
+        out = subprocess.run(
+            ["podman", "images", "--format", "{{.Repository}}:{{.Tag}}"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return set()
+    return set(out.split())
+
+
+def check_images(out=None):
     ok = True
+    # One listing instead of a `podman image exists` process per image
+    have = _local_images()
     for img in REQUIRED_IMAGES:
-        try:
-            subprocess.run(["podman", "image", "exists", img], check=True)
-            print(f"Image present: {img}")
-        except subprocess.CalledProcessError:
-            print(f"Image missing (recommended): {img}")
+        # Untagged names refer to :latest, as with `podman image exists`
+        ref = img if ":" in img.rsplit("/", 1)[-1] else f"{img}:latest"
+        if ref in have:
+            print(f"Image present: {img}", file=out)
+        else:
+            print(f"Image missing (recommended): {img}", file=out)
             ok = False
     if not ok:
         print(
-            "Tip: pre-pull images with 'podman pull <image>' to avoid runtime pulls and auth issues."
+            "Tip: pre-pull images with 'podman pull <image>' to avoid runtime pulls and auth issues.",
+            file=out,
         )
     return ok
 
 
 if __name__ == "__main__":
-    ok = True
-    ok = ok and check_podman()
-    ok = ok and check_seccomp_files()
-    check_images()
+    # The checks are independent, so run them side by side; each one prints
+    # into its own buffer, flushed in order so the output reads as before
+    checks = (check_podman, check_seccomp_files, check_images)
+    buffers = [io.StringIO() for _ in checks]
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [
+            executor.submit(check, out=buf) for check, buf in zip(checks, buffers)
+        ]
+    results = []
+    for future, buf in zip(futures, buffers):
+        sys.stdout.write(buf.getvalue())
+        results.append(future.result())
+    podman_ok, seccomp_ok, _ = results
+    ok = podman_ok and seccomp_ok
     if not ok:
         print("Preflight checks failed. Please fix errors and re-run.")
         sys.exit(2)
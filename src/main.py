@@ -1,8 +1,10 @@
 import argparse
+import contextlib
+import io
 import json
 import os
 import sys
-from typing import Any
+from typing import Any, TextIO
 
 from src.models.project import Project
 from src.orchestration.workflow import Workflow
@@ -39,15 +41,31 @@ def main() -> None:
     )
     parser.add_argument(
         "--database-path",
-        required=True,
         help="Path to the offline vulnerability database (e.g., data/offline-db.tar.gz).",
     )
     parser.add_argument(
         "--network-allowlist", help="Path to the network-allowlist.txt file."
     )
+    parser.add_argument(
+        "--serve-stdio",
+        action="store_true",
+        help="Serve scan requests as JSON lines on stdin/stdout (used by the MCP server).",
+    )
 
     args = parser.parse_args()
 
+    # Persistent worker mode: each request carries its own paths
+    if args.serve_stdio:
+        # Keep the real stdout for protocol replies and send anything else that
+        # writes to fd 1 (e.g. child processes) to stderr instead.
+        protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+        _serve_stdio(sys.stdin, protocol_out)
+        return
+
+    if not args.database_path:
+        parser.error("--database-path is required")
+
     # Handle MCP server mode
     if args.mcp_server:
         try:
@@ -81,6 +99,47 @@ def main() -> None:
     if not args.output:
         parser.error("--output is required when not in MCP server mode")
 
+    _run_scan(args)
+
+
+def _serve_stdio(instream: TextIO, outstream: TextIO) -> None:
+    """Answer scan requests read one JSON object per line from ``instream``.
+
+    Requests look like ``{"input": ..., "output": ..., "db": ...}`` with an
+    optional ``network_allowlist``. Each reply is a single JSON line with the
+    ``exitCode`` and the captured ``log`` of that scan.
+    """
+    for line in instream:
+        if not line.strip():
+            continue
+        buf = io.StringIO()
+        try:
+            request = json.loads(line)
+            scan_args = argparse.Namespace(
+                input=request["input"],
+                output=request["output"],
+                database_path=request["db"],
+                network_allowlist=request.get("network_allowlist"),
+            )
+            with contextlib.redirect_stdout(buf):
+                _run_scan(scan_args)
+            rc = 0
+        except SystemExit as e:
+            # A scan that exits ends only this request, not the worker
+            if e.code is None or isinstance(e.code, int):
+                rc = e.code or 0
+            else:
+                buf.write(f"{e.code}\n")
+                rc = 1
+        except Exception as e:
+            buf.write(f"Error: {e}\n")
+            rc = 1
+        outstream.write(json.dumps({"exitCode": rc, "log": buf.getvalue()}) + "\n")
+        outstream.flush()
+
+
+def _run_scan(args: argparse.Namespace) -> None:
+    """Scan every project listed in ``args.input`` and write the report."""
     print(
         f"Starting GeoToolKit scan with input: {args.input}, output: {args.output}, database: {args.database_path}"
     )
@@ -1,5 +1,6 @@
 import os
 import subprocess
+import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, List, Optional
@@ -14,7 +15,9 @@ def _ensure_logs_dir() -> Path:
 def _make_log_file(tool: str) -> Path:
     logs = _ensure_logs_dir()
     ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-    return logs / f"{tool}-{ts}.log"
+    # Runs of the same tool can start within the same second (parallel test
+    # suites, concurrent scans), so make every name unique
+    return logs / f"{tool}-{ts}-{os.getpid()}-{uuid.uuid4().hex[:8]}.log"
 
 
 def choose_seccomp_path(
@@ -57,3 +57,43 @@ def test_cli_runs_and_generates_report(tmp_path):
     assert out.exists()
     content = out.read_text()
     assert "Scan Report" in content or "Security" in content
+
+
+def test_serve_stdio_answers_one_json_line_per_request(tmp_path):
+    import io
+
+    from src.main import _serve_stdio
+
+    proj = write_projects(tmp_path)
+    out = tmp_path / "report.md"
+    request = {"input": str(proj), "output": str(out), "db": str(tmp_path / "db")}
+    instream = io.StringIO(json.dumps(request) + "\n\n" + "not json\n")
+    outstream = io.StringIO()
+
+    with mock_patch(
+        "src.orchestration.workflow.Workflow._run_security_scans", return_value=[]
+    ):
+        _serve_stdio(instream, outstream)
+
+    replies = [json.loads(line) for line in outstream.getvalue().splitlines()]
+    assert [r["exitCode"] for r in replies] == [0, 1]
+    assert "Report generation complete." in replies[0]["log"]
+    assert out.exists()
+
+
+def test_serve_stdio_survives_a_scan_that_exits(tmp_path):
+    import io
+
+    from src.main import _serve_stdio
+
+    request = json.dumps({"input": "in.json", "output": "out.md", "db": "db"})
+    instream = io.StringIO(f"{request}\n{request}\n")
+    outstream = io.StringIO()
+
+    exits = [SystemExit(2), SystemExit("bad input")]
+    with mock_patch("src.main._run_scan", side_effect=exits):
+        _serve_stdio(instream, outstream)
+
+    replies = [json.loads(line) for line in outstream.getvalue().splitlines()]
+    assert [r["exitCode"] for r in replies] == [2, 1]
+    assert "bad input" in replies[1]["log"]
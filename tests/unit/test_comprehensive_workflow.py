@@ -1,4 +1,5 @@
 import json
+import os
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -102,8 +103,11 @@ def test_mcp_runScan_mocks(tmp_path, mock_subprocess_run):
     # Mock output file creation (simulating the scanner creating it)
     report_file.write_text("# Mock Security Report")
 
-    # Call the tool
-    with patch("mcp_server.mcp_server.APP_ROOT", tmp_path):
+    # Call the tool (one-shot mode so the mocked subprocess.run is used)
+    with (
+        patch("mcp_server.mcp_server.APP_ROOT", tmp_path),
+        patch.dict(os.environ, {"GEOTOOLKIT_PERSIST": "0"}),
+    ):
         result = mcp_server.runScan(
             inputPath=str(projects_file.name),
             outputPath=str(report_file.name),
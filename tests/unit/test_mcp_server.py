@@ -2,6 +2,7 @@
 
 import json
 import os
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
@@ -200,3 +201,397 @@ def main():
 
         # The actual implementation should handle this gracefully
         assert True, "Graceful degradation should be handled in the real implementation"
+
+
+def test_mcp_json_helpers_round_trip(tmp_path):
+    """_write_json output should be indented, newline-terminated and readable by _loads."""
+    from mcp_server.mcp_server import _loads, _write_json
+
+    data = {"projects": [{"name": "café", "ports": ["80", "443"]}]}
+    out = tmp_path / "nested" / "projects.json"
+    _write_json(out, data)
+
+    raw = out.read_bytes()
+    assert raw.endswith(b"\n")
+    assert b'\n  "projects"' in raw
+    assert _loads(raw) == data
+    assert _loads(raw.decode("utf-8")) == data
+
+
+def test_mcp_derive_allowlists_is_memoized_and_mutation_safe():
+    """Repeated derivations hit the cache and never share list objects."""
+    from mcp_server.mcp_server import _derive_allowlists, _derive_allowlists_cached
+
+    project = {
+        "name": "cached",
+        "network_config": {
+            "ports": ["8080"],
+            "allowed_egress": {"localhost": ["8080"], "10.0.0.0/8": []},
+        },
+    }
+    _derive_allowlists_cached.cache_clear()
+    first = _derive_allowlists(project)
+    first[0].append("mutated:1")
+    second = _derive_allowlists(project)
+
+    assert _derive_allowlists_cached.cache_info().hits == 1
+    assert second == (["localhost:8080"], ["10.0.0.0/8"], ["8080"])
+
+
+def test_mcp_run_scan_falls_back_when_worker_unavailable(tmp_path):
+    """runScan should use the one-shot command chain if no worker can start."""
+    from mcp_server import mcp_server
+
+    mcp_server._stop_scan_worker()
+    with (
+        patch.object(
+            mcp_server, "_SCAN_WORKER_CMDS", (("geotoolkit-missing-binary",),)
+        ),
+        patch.object(mcp_server, "_run_cmd", return_value=(0, "one-shot")) as run_cmd,
+    ):
+        result = mcp_server.runScan(
+            inputPath=str(tmp_path / "projects.json"),
+            outputPath=str(tmp_path / "report.md"),
+        )
+
+    assert result == {"exitCode": 0, "report": "", "log": "one-shot"}
+    assert run_cmd.call_count == 1
+
+
+def test_mcp_derive_allowlists_sanitizes_inputs():
+    """Whitespace and empty entries are dropped; scalars are treated as one item."""
+    from mcp_server.mcp_server import _derive_allowlists
+
+    project = {
+        "network_config": {
+            "ports": [" 8080 ", "", 9090],
+            "allowed_egress": {
+                "external_hosts": " example.com ",
+                "db.internal": "5432",
+                "cache.internal": ["", "  "],
+            },
+        }
+    }
+    hosts, cidrs, ports = _derive_allowlists(project)
+    assert ports == ["8080", "9090"]
+    assert cidrs == []
+    assert hosts == [
+        "cache.internal:8080",
+        "cache.internal:9090",
+        "db.internal:5432",
+        "example.com:8080",
+        "example.com:9090",
+    ]
+
+
+def test_mcp_normalize_projects_writes_sorted_allowlists(tmp_path):
+    """normalizeProjects fills missing fields with sorted lists and previews them."""
+    from mcp_server import mcp_server
+
+    src = tmp_path / "projects.json"
+    src.write_text(
+        json.dumps(
+            {
+                "projects": [
+                    {
+                        "name": "svc",
+                        "network_config": {
+                            "ports": ["8080"],
+                            "allowed_egress": {
+                                "zeta.local": [],
+                                "alpha.local": [],
+                                "10.0.0.0/8": [],
+                            },
+                        },
+                    },
+                    {"name": "plain"},
+                ]
+            }
+        )
+    )
+    with patch.object(mcp_server, "APP_ROOT", tmp_path):
+        result = mcp_server.normalizeProjects(inputPath="projects.json")
+
+    assert result["ok"] is True
+    written = json.loads(src.read_text())["projects"]
+    assert written[0]["network_allow_hosts"] == ["alpha.local:8080", "zeta.local:8080"]
+    assert written[0]["network_allow_ip_ranges"] == ["10.0.0.0/8"]
+    assert written[1] == {"name": "plain"}
+    assert result["preview"][0]["hosts"] == written[0]["network_allow_hosts"]
+
+
+def test_mcp_tools_registered_on_import():
+    """Importing the module registers every tool, without needing main()."""
+    import asyncio
+
+    from mcp_server import mcp_server
+
+    names = [name for name, _ in mcp_server._TOOLS]
+    assert {"createProjects", "runScan", "normalizeProjects"} <= set(names)
+    assert mcp_server._tools_registered is True
+    if hasattr(mcp_server.mcp, "list_tools"):
+        tools = asyncio.run(mcp_server.mcp.list_tools())
+        assert {tool.name for tool in tools} == set(names)
+
+
+def test_mcp_register_tools_is_idempotent():
+    """_register_tools() hands each tool to FastMCP exactly once."""
+    from mcp_server import mcp_server
+
+    names = [name for name, _ in mcp_server._TOOLS]
+
+    with (
+        patch.object(mcp_server, "_tools_registered", False),
+        patch.object(mcp_server.mcp, "tool") as tool,
+    ):
+        mcp_server._register_tools()
+        mcp_server._register_tools()
+
+    assert tool.call_count == len(names)
+
+
+def test_mcp_run_cmd_passes_trimmed_environment():
+    """Subprocesses get PATH and scanner settings but not unrelated variables."""
+    from mcp_server import mcp_server
+
+    extra = {"GEOTOOLKIT_USE_SECCOMP": "1", "ZAP_PORT": "8090", "SOME_HOST_TOKEN": "x"}
+    with (
+        patch.dict(os.environ, extra),
+        patch("mcp_server.mcp_server.subprocess.run") as run,
+    ):
+        run.return_value.returncode = 0
+        run.return_value.stdout = ""
+        run.return_value.stderr = ""
+        mcp_server._run_cmd(["true"])
+
+    env = run.call_args.kwargs["env"]
+    assert env["GEOTOOLKIT_USE_SECCOMP"] == "1"
+    assert env["ZAP_PORT"] == "8090"
+    assert "PATH" in env
+    assert "SOME_HOST_TOKEN" not in env
+
+
+def test_mcp_prepare_and_scan_writes_once_then_scans(tmp_path):
+    """prepareAndScan should write projects.json and hand it to runScan."""
+    from mcp_server import mcp_server
+
+    projects = [{"url": "https://github.com/example/repo", "name": "repo"}]
+    scan_result = {"exitCode": 0, "report": "# Report", "log": ""}
+    with (
+        patch.object(mcp_server, "APP_ROOT", tmp_path),
+        patch.object(mcp_server, "runScan", return_value=scan_result) as run_scan,
+    ):
+        result = mcp_server.prepareAndScan(projects, inputPath="in/projects.json")
+
+    written = tmp_path / "in" / "projects.json"
+    assert json.loads(written.read_text()) == {"projects": projects}
+    assert run_scan.call_args.kwargs["inputPath"] == str(written)
+    assert result["project_count"] == 1
+    assert result["report"] == "# Report"
+
+
+def _wait_for_job(mcp_server, job_id, timeout=10.0):
+    import time
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = mcp_server.pollJob(job_id)
+        if status["status"] != "running":
+            return status
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_mcp_scan_jobs_poll_and_cancel(tmp_path):
+    """startScan returns a job id; pollJob reports completion, cancelJob stops it."""
+    from mcp_server import mcp_server
+
+    def fake_command(script):
+        return lambda scan_args: [sys.executable, "-c", script]
+
+    with (
+        patch.object(mcp_server, "APP_ROOT", tmp_path),
+        patch.object(
+            mcp_server,
+            "_scan_command",
+            fake_command(
+                "import pathlib; pathlib.Path('report.md').write_text('# Done');"
+                "print('scanned')"
+            ),
+        ),
+    ):
+        started = mcp_server.startScan(outputPath="report.md")
+        done = _wait_for_job(mcp_server, started["jobId"])
+
+    assert done["status"] == "done"
+    assert done["exitCode"] == 0
+    assert done["report"] == "# Done"
+    assert "scanned" in done["log"]
+    # Finished jobs are reported once and then released
+    assert started["jobId"] not in mcp_server._JOBS
+    assert mcp_server.pollJob(started["jobId"])["ok"] is False
+
+    with patch.object(
+        mcp_server, "_scan_command", fake_command("import time; time.sleep(30)")
+    ):
+        job_id = mcp_server.startScan(outputPath=str(tmp_path / "r.md"))["jobId"]
+    assert mcp_server.pollJob(job_id)["status"] == "running"
+    assert mcp_server.cancelJob(job_id)["status"] == "cancelled"
+    assert mcp_server.pollJob(job_id)["status"] == "cancelled"
+    assert mcp_server.pollJob("missing")["ok"] is False
+
+
+def test_mcp_scan_jobs_are_killed_after_deadline(tmp_path):
+    """The reaper thread kills jobs that run past timeout_seconds."""
+    from mcp_server import mcp_server
+
+    with (
+        patch.object(mcp_server, "_REAPER_INTERVAL", 0.05),
+        patch.object(
+            mcp_server,
+            "_scan_command",
+            lambda scan_args: [sys.executable, "-c", "import time; time.sleep(30)"],
+        ),
+    ):
+        job_id = mcp_server.startScan(
+            outputPath=str(tmp_path / "r.md"), timeout_seconds=0
+        )["jobId"]
+        result = _wait_for_job(mcp_server, job_id)
+
+    assert result["status"] == "timeout"
+    assert result["exitCode"] == 124
+
+
+def test_mcp_unpolled_jobs_are_dropped_after_retention(tmp_path):
+    """The reaper releases finished jobs nobody polls once retention expires."""
+    import time
+
+    from mcp_server import mcp_server
+
+    with (
+        patch.object(mcp_server, "_REAPER_INTERVAL", 0.05),
+        patch.object(mcp_server, "_JOB_RETENTION", 0),
+        patch.object(
+            mcp_server, "_scan_command", lambda scan_args: [sys.executable, "-c", ""]
+        ),
+    ):
+        job_id = mcp_server.startScan(outputPath=str(tmp_path / "r.md"))["jobId"]
+        log = mcp_server._JOBS[job_id].log
+        deadline = time.monotonic() + 10
+        while job_id in mcp_server._JOBS and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    assert job_id not in mcp_server._JOBS
+    assert log.closed
+
+
+def test_mcp_server_imports_when_run_as_script(tmp_path):
+    """``python mcp_server/mcp_server.py`` must resolve the package helpers.
+
+    As a script only the file's own directory is on sys.path, so run it the
+    same way (without calling main()) from an unrelated working directory.
+    """
+    script = Path(__file__).resolve().parents[2] / "mcp_server" / "mcp_server.py"
+    code = (
+        "import runpy, sys; "
+        f"sys.path[0] = {str(script.parent)!r}; "
+        f"runpy.run_path({str(script)!r}, run_name='geotoolkit_script_check')"
+    )
+    res = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert res.returncode == 0, res.stderr
+
+
+def test_mcp_scan_worker_is_replaced_after_timeout():
+    """A worker that misses the deadline is killed rather than reused."""
+    from mcp_server import mcp_server
+
+    if not mcp_server._WORKER_SUPPORTED:
+        pytest.skip("persistent scan worker is POSIX-only")
+
+    spawned = []
+    spawn = mcp_server._spawn_scan_worker
+
+    def tracking_spawn():
+        proc = spawn()
+        spawned.append(proc)
+        return proc
+
+    hang = "import sys, time; sys.stdin.readline(); time.sleep(30)"
+    mcp_server._stop_scan_worker()
+    with (
+        patch.object(mcp_server, "_SCAN_WORKER_CMDS", ((sys.executable, "-c", hang),)),
+        patch.object(mcp_server, "_spawn_scan_worker", tracking_spawn),
+    ):
+        rc, log = mcp_server._scan_worker_request({}, timeout=0.2)
+
+    assert rc == 124
+    assert "timed out" in log
+    assert mcp_server._scan_worker is None
+    assert spawned[0].poll() is not None
+
+
+def _process_running(pid):
+    """True while ``pid`` exists and is not a zombie."""
+    try:
+        with open(f"/proc/{pid}/stat") as fh:
+            return fh.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+    except OSError:  # pragma: no cover - no procfs
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+
+@pytest.mark.parametrize("stop", ["cancel", "timeout"])
+def test_mcp_stopped_jobs_leave_no_child_processes(tmp_path, stop):
+    """Cancel and timeout stop the scan's children, not just the launcher."""
+    import time
+
+    from mcp_server import mcp_server
+
+    if not hasattr(os, "killpg"):
+        pytest.skip("process groups are POSIX-only")
+
+    # Stands in for ``uv run``: a launcher whose child does the actual work
+    pid_file = tmp_path / "child.pid"
+    launcher = (
+        "import pathlib, subprocess, sys, time; "
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']); "
+        f"pathlib.Path({str(pid_file)!r}).write_text(str(child.pid)); "
+        "time.sleep(60)"
+    )
+    with (
+        patch.object(mcp_server, "_REAPER_INTERVAL", 0.05),
+        patch.object(
+            mcp_server,
+            "_scan_command",
+            lambda scan_args: [sys.executable, "-c", launcher],
+        ),
+    ):
+        job_id = mcp_server.startScan(
+            outputPath=str(tmp_path / "r.md"),
+            timeout_seconds=60 if stop == "cancel" else 2,
+        )["jobId"]
+        deadline = time.monotonic() + 10
+        while not pid_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        child_pid = int(pid_file.read_text())
+
+        if stop == "cancel":
+            assert mcp_server.cancelJob(job_id)["status"] == "cancelled"
+        else:
+            assert _wait_for_job(mcp_server, job_id)["status"] == "timeout"
+
+    deadline = time.monotonic() + 5
+    while _process_running(child_pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _process_running(child_pid)
@@ -46,3 +46,16 @@ def test_no_dev_null_sentinel(tmp_path, monkeypatch):
     assert "/dev/null" not in joined, (
         f"Unexpected sentinel present in podman command: {joined}"
     )
+
+
+def test_log_files_are_unique_per_run(tmp_path, monkeypatch):
+    """Runs started in the same second must not share a log file."""
+    from src.orchestration.podman_helper import _make_log_file
+
+    monkeypatch.chdir(tmp_path)
+    first = _make_log_file("osv-scanner")
+    second = _make_log_file("osv-scanner")
+
+    assert first != second
+    assert first.parent == second.parent == tmp_path / "logs"
+    assert first.name.startswith("osv-scanner-")